@@ -0,0 +1,40 @@
+import asyncio
+from typing import List
+
+from playwright.async_api import Browser, async_playwright
+
+from playwright_recaptcha import recaptchav2
+
+URLS = ["https://www.google.com/recaptcha/api2/demo"] * 4
+CONCURRENCY = 2
+
+
+async def solve(browser: Browser, semaphore: asyncio.Semaphore, url: str) -> str:
+    async with semaphore:
+        context = await browser.new_context()
+
+        try:
+            page = await context.new_page()
+            await page.goto(url)
+
+            async with recaptchav2.AsyncSolver(page) as solver:
+                return await solver.solve_recaptcha(wait=True)
+        finally:
+            await context.close()
+
+
+async def main() -> None:
+    async with async_playwright() as playwright:
+        browser = await playwright.firefox.launch()
+        semaphore = asyncio.Semaphore(CONCURRENCY)
+
+        tokens: List[str] = await asyncio.gather(
+            *(solve(browser, semaphore, url) for url in URLS)
+        )
+
+        for token in tokens:
+            print(token)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -3,18 +3,14 @@ from __future__ import annotations
 import asyncio
 import base64
 import functools
-import re
-from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime
-from io import BytesIO
+import time
 from json import JSONDecodeError
-from typing import Any, BinaryIO, Dict, List, Optional, Union
+from typing import Any, Awaitable, Dict, List, Optional
 from urllib.parse import parse_qs, urlparse
 
 import speech_recognition
-from playwright.async_api import Locator, Page, Response
-from pydub import AudioSegment
-from pydub.exceptions import CouldntDecodeError
+from playwright.async_api import Page, Response
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from tenacity import (
     AsyncRetrying,
     retry_if_exception_type,
@@ -28,39 +24,16 @@ from ..errors import (
     RecaptchaRateLimitError,
     RecaptchaSolveError,
 )
-from .base_solver import BaseSolver
+from .base_solver import (
+    PAYLOAD_URL_PATTERN,
+    RELOAD_URL_PATTERN,
+    TASK_OBJECT_IDS,
+    TOKEN_TIMEOUT,
+    USERVERIFY_URL_PATTERN,
+    BaseSolver,
+)
 from .recaptcha_box import AsyncRecaptchaBox
-from .translations import OBJECT_TRANSLATIONS, ORIGINAL_LANGUAGE_AUDIO
-
-
-class AsyncAudioFile(speech_recognition.AudioFile):
-    """
-    A subclass of `speech_recognition.AudioFile` that can be used asynchronously.
-
-    Parameters
-    ----------
-    file : Union[BinaryIO, str]
-        The audio file handle or file path.
-    executor : Optional[ThreadPoolExecutor], optional
-        The thread pool executor to use, by default None.
-    """
-
-    def __init__(
-        self,
-        file: Union[BinaryIO, str],
-        *,
-        executor: Optional[ThreadPoolExecutor] = None,
-    ) -> None:
-        super().__init__(file)
-        self._loop = asyncio.get_event_loop()
-        self._executor = executor
-
-    async def __aenter__(self) -> AsyncAudioFile:
-        await self._loop.run_in_executor(self._executor, self.__enter__)
-        return self
-
-    async def __aexit__(self, *args: Any) -> None:
-        await self._loop.run_in_executor(self._executor, self.__exit__, *args)
+from .translations import ORIGINAL_LANGUAGE_AUDIO
 
 
 class AsyncSolver(BaseSolver[Page]):
@@ -78,6 +51,12 @@ class AsyncSolver(BaseSolver[Page]):
         If None, the `CAPSOLVER_API_KEY` environment variable will be used.
     """
 
+    def __init__(
+        self, page: Page, *, attempts: int = 5, capsolver_api_key: Optional[str] = None
+    ) -> None:
+        self._token_event = asyncio.Event()
+        super().__init__(page, attempts=attempts, capsolver_api_key=capsolver_api_key)
+
     async def __aenter__(self) -> AsyncSolver:
         return self
 
@@ -99,33 +78,34 @@ class AsyncSolver(BaseSolver[Page]):
         Optional[str]
             The object ID. Returns None if the task object is not recognized.
         """
-        object_dict = {
-            "/m/0pg52": OBJECT_TRANSLATIONS["taxis"],
-            "/m/01bjv": OBJECT_TRANSLATIONS["bus"],
-            "/m/04_sv": OBJECT_TRANSLATIONS["motorcycles"],
-            "/m/013xlm": OBJECT_TRANSLATIONS["tractors"],
-            "/m/01jk_4": OBJECT_TRANSLATIONS["chimneys"],
-            "/m/014xcs": OBJECT_TRANSLATIONS["crosswalks"],
-            "/m/015qff": OBJECT_TRANSLATIONS["traffic_lights"],
-            "/m/0199g": OBJECT_TRANSLATIONS["bicycles"],
-            "/m/015qbp": OBJECT_TRANSLATIONS["parking_meters"],
-            "/m/0k4j": OBJECT_TRANSLATIONS["cars"],
-            "/m/015kr": OBJECT_TRANSLATIONS["bridges"],
-            "/m/019jd": OBJECT_TRANSLATIONS["boats"],
-            "/m/0cdl1": OBJECT_TRANSLATIONS["palm_trees"],
-            "/m/09d_r": OBJECT_TRANSLATIONS["mountains_or_hills"],
-            "/m/01pns0": OBJECT_TRANSLATIONS["fire_hydrant"],
-            "/m/01lynh": OBJECT_TRANSLATIONS["stairs"],
-        }
+        object_ = await recaptcha_box.bframe_frame.locator(
+            ".rc-imageselect-desc-wrapper strong"
+        ).first.text_content()
 
-        task = await recaptcha_box.bframe_frame.locator("div").all_inner_texts()
-        object_ = task[0].split("\n")[1]
+        return TASK_OBJECT_IDS.get(object_)
 
-        for object_id, translations in object_dict.items():
-            if object_ in translations:
-                return object_id
+    @staticmethod
+    async def _gather(*awaitables: Awaitable[Any]) -> List[Any]:
+        """
+        Run awaitables concurrently, cancelling the rest if one of them fails.
 
-        return None
+        Parameters
+        ----------
+        *awaitables : Awaitable[Any]
+            The awaitables to run.
+
+        Returns
+        -------
+        List[Any]
+            The results in the order of the awaitables.
+        """
+        tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+
+        try:
+            return await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
 
     async def _response_callback(self, response: Response) -> None:
         """
@@ -136,49 +116,82 @@ class AsyncSolver(BaseSolver[Page]):
         response : Response
             The response.
         """
+        url = response.url
+
+        if "/recaptcha/" not in url:
+            return
+
         if (
-            re.search("/recaptcha/(api2|enterprise)/payload", response.url) is not None
-            and self._payload_response is None
+            self._payload_response is None
+            and PAYLOAD_URL_PATTERN.search(url) is not None
         ):
             self._payload_response = response
-        elif (
-            re.search("/recaptcha/(api2|enterprise)/userverify", response.url)
-            is not None
-        ):
-            token_match = re.search('"uvresp","(.*?)"', await response.text())
+        elif self._token is None and USERVERIFY_URL_PATTERN.search(url) is not None:
+            token = self._extract_token(await response.body())
+
+            if token is not None:
+                self._token = token
+                self._token_event.set()
 
-            if token_match is not None:
-                self._token = token_match.group(1)
+    def _close_callback(self, _: Page) -> None:
+        """Stop waiting for the reCAPTCHA token once the page has closed."""
+        self._token_event.set()
+
+    async def _wait_for_token(self) -> str:
+        """
+        Wait for the userverify response to deliver the reCAPTCHA token.
+
+        Returns
+        -------
+        str
+            The `g-recaptcha-response` token.
+
+        Raises
+        ------
+        RecaptchaSolveError
+            If the page was closed or the token was not received in time.
+        """
+        self._page.on("close", self._close_callback)
+
+        try:
+            await asyncio.wait_for(self._token_event.wait(), TOKEN_TIMEOUT)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._page.remove_listener("close", self._close_callback)
+
+        if self._token is None:
+            raise RecaptchaSolveError(
+                "The reCAPTCHA token was not received before the page closed "
+                "or the timeout was exceeded."
+            )
+
+        return self._token
 
     async def _get_capsolver_response(
-        self, recaptcha_box: AsyncRecaptchaBox, image_data: bytes
-    ) -> Optional[Dict[str, Any]]:
+        self, image_data: bytes, task_object: str
+    ) -> Dict[str, Any]:
         """
         Get the CapSolver JSON response for an image.
 
         Parameters
         ----------
-        recaptcha_box : AsyncRecaptchaBox
-            The reCAPTCHA box.
         image_data : bytes
             The image data.
+        task_object : str
+            The ID of the object in the reCAPTCHA image challenge task.
 
         Returns
         -------
-        Optional[Dict[str, Any]]
+        Dict[str, Any]
             The CapSolver JSON response.
-            Returns None if the task object is not recognized.
 
         Raises
         ------
         CapSolverError
             If the CapSolver API returned an error.
         """
-        image = base64.b64encode(image_data).decode("utf-8")
-        task_object = await self._get_task_object(recaptcha_box)
-
-        if task_object is None:
-            return None
+        image = base64.b64encode(image_data).decode("ascii")
 
         payload = {
             "clientKey": self._capsolver_api_key,
@@ -204,7 +217,7 @@ class AsyncSolver(BaseSolver[Page]):
         return response_json
 
     async def _solve_tiles(
-        self, recaptcha_box: AsyncRecaptchaBox, indexes: List[int]
+        self, recaptcha_box: AsyncRecaptchaBox, indexes: List[int], task_object: str
     ) -> None:
         """
         Solve the tiles in the reCAPTCHA image challenge.
@@ -215,14 +228,16 @@ class AsyncSolver(BaseSolver[Page]):
             The reCAPTCHA box.
         indexes : List[int]
             The indexes of the tiles that contain the task object.
+        task_object : str
+            The ID of the object in the reCAPTCHA image challenge task.
 
         Raises
         ------
         CapSolverError
             If the CapSolver API returned an error.
         """
-        changing_tiles: Dict[Locator, str] = {}
-        indexes = indexes.copy()
+        tiles = recaptcha_box.tile_selector
+        changing_tiles: Dict[int, str] = {}
 
         style_script = """
         (element) => {
@@ -231,41 +246,62 @@ class AsyncSolver(BaseSolver[Page]):
         }
         """
 
+        state_script = """
+        (tiles) => tiles.map((tile) => ({
+            isChanging: tile.classList.contains("rc-imageselect-dynamic-selected"),
+            imageUrl: tile.querySelector("img")?.getAttribute("src"),
+        }))
+        """
+
+        initial_states = await tiles.evaluate_all(state_script)
+
         for index in indexes:
-            tile = recaptcha_box.tile_selector.nth(index)
-            await tile.click()
+            await tiles.nth(index).click()
+
+        tile_states = await tiles.evaluate_all(state_script)
 
-            if "rc-imageselect-dynamic-selected" not in await tile.get_attribute(
-                "class"
+        for index in indexes:
+            image_url = initial_states[index]["imageUrl"]
+
+            if (
+                not tile_states[index]["isChanging"]
+                and tile_states[index]["imageUrl"] == image_url
             ):
                 continue
 
-            changing_tiles[tile] = await tile.locator("img").get_attribute("src")
-            await tile.evaluate(style_script)
+            changing_tiles[index] = image_url
+            await tiles.nth(index).evaluate(style_script)
 
-        start_time = datetime.now()
+        deadline = time.monotonic() + 60
 
-        while changing_tiles and (datetime.now() - start_time).seconds < 60:
-            for tile in changing_tiles.copy():
-                image_url = await tile.locator("img").get_attribute("src")
+        while changing_tiles and time.monotonic() < deadline:
+            new_tiles: Dict[int, str] = {}
+            tile_states = await tiles.evaluate_all(state_script)
 
-                if changing_tiles[tile] == image_url:
-                    continue
+            for index, image_url in changing_tiles.items():
+                new_image_url = tile_states[index]["imageUrl"]
 
-                changing_tiles[tile] = image_url
-                response = await self._page.request.get(image_url)
+                if new_image_url is not None and new_image_url != image_url:
+                    new_tiles[index] = new_image_url
 
-                capsolver_response = await self._get_capsolver_response(
-                    recaptcha_box, await response.body()
-                )
+            changing_tiles.update(new_tiles)
 
-                if (
-                    capsolver_response is None
-                    or not capsolver_response["solution"]["hasObject"]
-                ):
-                    changing_tiles.pop(tile)
+            responses = await self._gather(
+                *(self._page.request.get(image_url) for image_url in new_tiles.values())
+            )
+
+            images = await self._gather(*(response.body() for response in responses))
+
+            capsolver_responses = await self._gather(
+                *(self._get_capsolver_response(image, task_object) for image in images)
+            )
+
+            for index, capsolver_response in zip(new_tiles, capsolver_responses):
+                if not capsolver_response["solution"]["hasObject"]:
+                    changing_tiles.pop(index)
                     continue
 
+                tile = tiles.nth(index)
                 await tile.click()
                 await tile.evaluate(style_script)
 
@@ -291,30 +327,18 @@ class AsyncSolver(BaseSolver[Page]):
         loop = asyncio.get_event_loop()
         response = await self._page.request.get(audio_url)
 
-        wav_audio = BytesIO()
-        mp3_audio = BytesIO(await response.body())
-
-        try:
-            audio: AudioSegment = await loop.run_in_executor(
-                None, AudioSegment.from_mp3, mp3_audio
-            )
-        except CouldntDecodeError:
-            return None
-
-        await loop.run_in_executor(
-            None, functools.partial(audio.export, wav_audio, format="wav")
+        audio_data = await loop.run_in_executor(
+            None, self._convert_audio_to_audio_data, await response.body()
         )
 
-        recognizer = speech_recognition.Recognizer()
-
-        async with AsyncAudioFile(wav_audio) as source:
-            audio_data = await loop.run_in_executor(None, recognizer.record, source)
+        if audio_data is None:
+            return None
 
         try:
             return await loop.run_in_executor(
                 None,
                 functools.partial(
-                    recognizer.recognize_google, audio_data, language=language
+                    self._recognizer.recognize_google, audio_data, language=language
                 ),
             )
         except speech_recognition.UnknownValueError:
@@ -393,9 +417,7 @@ class AsyncSolver(BaseSolver[Page]):
         """
         await recaptcha_box.audio_challenge_textbox.fill(text)
 
-        async with self._page.expect_response(
-            re.compile("/recaptcha/(api2|enterprise)/userverify")
-        ) as response:
+        async with self._page.expect_response(USERVERIFY_URL_PATTERN) as response:
             await recaptcha_box.verify_button.click()
 
         await response.value
@@ -443,9 +465,7 @@ class AsyncSolver(BaseSolver[Page]):
                 await recaptcha_box.check_new_images_is_visible()
                 or await recaptcha_box.select_all_matching_is_visible()
             ):
-                async with self._page.expect_response(
-                    re.compile("/recaptcha/(api2|enterprise)/payload")
-                ) as response:
+                async with self._page.expect_response(PAYLOAD_URL_PATTERN) as response:
                     await recaptcha_box.new_challenge_button.click()
 
                 await response.value
@@ -470,33 +490,41 @@ class AsyncSolver(BaseSolver[Page]):
             If the reCAPTCHA rate limit has been exceeded.
         """
         while recaptcha_box.frames_are_attached():
-            capsolver_response = await self._get_capsolver_response(
-                recaptcha_box, await self._payload_response.body()
-            )
+            task_object = await self._get_task_object(recaptcha_box)
+            capsolver_response = None
+
+            if task_object is not None:
+                capsolver_response = await self._get_capsolver_response(
+                    await self._payload_response.body(), task_object
+                )
 
             if (
                 capsolver_response is None
                 or not capsolver_response["solution"]["objects"]
             ):
-                self._payload_response = None
-
-                async with self._page.expect_response(
-                    re.compile("/recaptcha/(api2|enterprise)/reload")
-                ) as response:
-                    await recaptcha_box.new_challenge_button.click()
-
-                await response.value
-
-                while self._payload_response is None:
+                try:
+                    async with self._page.expect_response(
+                        PAYLOAD_URL_PATTERN
+                    ) as response:
+                        async with self._page.expect_response(RELOAD_URL_PATTERN):
+                            await recaptcha_box.new_challenge_button.click()
+
+                        while not response.is_done():
+                            if await recaptcha_box.rate_limit_is_visible():
+                                raise RecaptchaRateLimitError
+
+                            await self._page.wait_for_timeout(250)
+                except PlaywrightTimeoutError as err:
                     if await recaptcha_box.rate_limit_is_visible():
-                        raise RecaptchaRateLimitError
+                        raise RecaptchaRateLimitError from err
 
-                    await self._page.wait_for_timeout(250)
+                    raise
 
+                self._payload_response = await response.value
                 continue
 
             await self._solve_tiles(
-                recaptcha_box, capsolver_response["solution"]["objects"]
+                recaptcha_box, capsolver_response["solution"]["objects"], task_object
             )
 
             self._payload_response = None
@@ -506,9 +534,7 @@ class AsyncSolver(BaseSolver[Page]):
                 await self._submit_tile_answers(recaptcha_box)
                 return
 
-            async with self._page.expect_response(
-                re.compile("/recaptcha/(api2|enterprise)/payload")
-            ):
+            async with self._page.expect_response(PAYLOAD_URL_PATTERN):
                 await button.click()
 
     async def _solve_audio_challenge(self, recaptcha_box: AsyncRecaptchaBox) -> None:
@@ -539,9 +565,7 @@ class AsyncSolver(BaseSolver[Page]):
             if text is not None:
                 break
 
-            async with self._page.expect_response(
-                re.compile("/recaptcha/(api2|enterprise)/reload")
-            ) as response:
+            async with self._page.expect_response(RELOAD_URL_PATTERN) as response:
                 await recaptcha_box.new_challenge_button.click()
 
             await response.value
@@ -612,76 +636,79 @@ class AsyncSolver(BaseSolver[Page]):
             )
 
         self._token = None
+        self._token_event.clear()
         attempts = attempts or self._attempts
+        self._page.on("response", self._response_callback)
 
-        if wait:
-            retry = AsyncRetrying(
-                sleep=self._page.wait_for_timeout,
-                stop=stop_after_delay(wait_timeout),
-                wait=wait_fixed(0.25),
-                retry=retry_if_exception_type(RecaptchaNotFoundError),
-                reraise=True,
-            )
-
-            recaptcha_box = await retry(
-                lambda: AsyncRecaptchaBox.from_frames(self._page.frames)
-            )
-        else:
-            recaptcha_box = await AsyncRecaptchaBox.from_frames(self._page.frames)
-
-        if await recaptcha_box.rate_limit_is_visible():
-            raise RecaptchaRateLimitError
-
-        if await recaptcha_box.checkbox.is_visible():
-            await self._click_checkbox(recaptcha_box)
+        try:
+            if wait:
+                retry = AsyncRetrying(
+                    sleep=self._page.wait_for_timeout,
+                    stop=stop_after_delay(wait_timeout),
+                    wait=wait_fixed(0.25),
+                    retry=retry_if_exception_type(RecaptchaNotFoundError),
+                    reraise=True,
+                )
 
-            if self._token is not None:
-                return self._token
+                recaptcha_box = await retry(
+                    lambda: AsyncRecaptchaBox.from_frames(self._page.frames)
+                )
+            else:
+                recaptcha_box = await AsyncRecaptchaBox.from_frames(self._page.frames)
 
-            if (
-                recaptcha_box.frames_are_detached()
-                or not await recaptcha_box.any_challenge_is_visible()
-                or await recaptcha_box.challenge_is_solved()
-            ):
-                while self._token is None:
-                    await self._page.wait_for_timeout(250)
+            if await recaptcha_box.rate_limit_is_visible():
+                raise RecaptchaRateLimitError
 
-                return self._token
+            if await recaptcha_box.checkbox.is_visible():
+                await self._click_checkbox(recaptcha_box)
 
-        while not await recaptcha_box.any_challenge_is_visible():
-            await self._page.wait_for_timeout(250)
+                if self._token is not None:
+                    return self._token
 
-        if image_challenge and await recaptcha_box.image_challenge_button.is_visible():
-            await recaptcha_box.image_challenge_button.click()
-        elif (
-            not image_challenge
-            and await recaptcha_box.audio_challenge_button.is_visible()
-        ):
-            await recaptcha_box.audio_challenge_button.click()
+                if (
+                    recaptcha_box.frames_are_detached()
+                    or not await recaptcha_box.any_challenge_is_visible()
+                    or await recaptcha_box.challenge_is_solved()
+                ):
+                    return await self._wait_for_token()
 
-        if image_challenge:
-            image = recaptcha_box.image_challenge.locator("img").first
-            image_url = await image.get_attribute("src")
-            self._payload_response = await self._page.request.get(image_url)
+            while not await recaptcha_box.any_challenge_is_visible():
+                await self._page.wait_for_timeout(250)
 
-        while attempts > 0:
-            self._token = None
+            if (
+                image_challenge
+                and await recaptcha_box.image_challenge_button.is_visible()
+            ):
+                await recaptcha_box.image_challenge_button.click()
+            elif (
+                not image_challenge
+                and await recaptcha_box.audio_challenge_button.is_visible()
+            ):
+                await recaptcha_box.audio_challenge_button.click()
 
             if image_challenge:
-                await self._solve_image_challenge(recaptcha_box)
-            else:
-                await self._solve_audio_challenge(recaptcha_box)
+                image = recaptcha_box.image_challenge.locator("img").first
+                image_url = await image.get_attribute("src")
+                self._payload_response = await self._page.request.get(image_url)
 
-            if (
-                recaptcha_box.frames_are_detached()
-                or not await recaptcha_box.any_challenge_is_visible()
-                or await recaptcha_box.challenge_is_solved()
-            ):
-                while self._token is None:
-                    await self._page.wait_for_timeout(250)
+            while attempts > 0:
+                self._token = None
+                self._token_event.clear()
 
-                return self._token
+                if image_challenge:
+                    await self._solve_image_challenge(recaptcha_box)
+                else:
+                    await self._solve_audio_challenge(recaptcha_box)
+
+                if (
+                    recaptcha_box.frames_are_detached()
+                    or not await recaptcha_box.any_challenge_is_visible()
+                    or await recaptcha_box.challenge_is_solved()
+                ):
+                    return await self._wait_for_token()
 
-            attempts -= 1
+                attempts -= 1
 
-        raise RecaptchaSolveError
+            raise RecaptchaSolveError
+        finally:
+            self.close()
@@ -1,20 +1,60 @@
 import os
+import re
+import subprocess
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, Iterable, Optional, TypeVar, Union
+from typing import Any, Dict, Generic, Iterable, Optional, Tuple, TypeVar, Union
 
+import speech_recognition
 from playwright.async_api import APIResponse as AsyncAPIResponse
 from playwright.async_api import Page as AsyncPage
 from playwright.async_api import Response as AsyncResponse
 from playwright.sync_api import APIResponse as SyncAPIResponse
 from playwright.sync_api import Page as SyncPage
 from playwright.sync_api import Response as SyncResponse
+from pydub import AudioSegment
 
 from .recaptcha_box import RecaptchaBox
+from .translations import OBJECT_TRANSLATIONS
 
 PageT = TypeVar("PageT", AsyncPage, SyncPage)
 APIResponse = Union[AsyncAPIResponse, SyncAPIResponse]
 Response = Union[AsyncResponse, SyncResponse]
 
+PAYLOAD_URL_PATTERN = re.compile("/recaptcha/(?:api2|enterprise)/payload")
+USERVERIFY_URL_PATTERN = re.compile("/recaptcha/(?:api2|enterprise)/userverify")
+RELOAD_URL_PATTERN = re.compile("/recaptcha/(?:api2|enterprise)/reload")
+TOKEN_PREFIX = b'"uvresp","'
+
+TOKEN_TIMEOUT = 30
+
+AUDIO_SAMPLE_RATE = 16000
+AUDIO_SAMPLE_WIDTH = 2
+
+TASK_OBJECTS: Dict[str, Tuple[str, ...]] = {
+    "/m/0pg52": OBJECT_TRANSLATIONS["taxis"],
+    "/m/01bjv": OBJECT_TRANSLATIONS["bus"],
+    "/m/04_sv": OBJECT_TRANSLATIONS["motorcycles"],
+    "/m/013xlm": OBJECT_TRANSLATIONS["tractors"],
+    "/m/01jk_4": OBJECT_TRANSLATIONS["chimneys"],
+    "/m/014xcs": OBJECT_TRANSLATIONS["crosswalks"],
+    "/m/015qff": OBJECT_TRANSLATIONS["traffic_lights"],
+    "/m/0199g": OBJECT_TRANSLATIONS["bicycles"],
+    "/m/015qbp": OBJECT_TRANSLATIONS["parking_meters"],
+    "/m/0k4j": OBJECT_TRANSLATIONS["cars"],
+    "/m/015kr": OBJECT_TRANSLATIONS["bridges"],
+    "/m/019jd": OBJECT_TRANSLATIONS["boats"],
+    "/m/0cdl1": OBJECT_TRANSLATIONS["palm_trees"],
+    "/m/09d_r": OBJECT_TRANSLATIONS["mountains_or_hills"],
+    "/m/01pns0": OBJECT_TRANSLATIONS["fire_hydrant"],
+    "/m/01lynh": OBJECT_TRANSLATIONS["stairs"],
+}
+
+TASK_OBJECT_IDS: Dict[str, str] = {
+    translation: object_id
+    for object_id, translations in TASK_OBJECTS.items()
+    for translation in translations
+}
+
 
 class BaseSolver(ABC, Generic[PageT]):
     """
@@ -40,7 +80,7 @@ class BaseSolver(ABC, Generic[PageT]):
 
         self._token: Optional[str] = None
         self._payload_response: Union[APIResponse, Response, None] = None
-        self._page.on("response", self._response_callback)
+        self._recognizer = speech_recognition.Recognizer()
 
     def __repr__(self) -> str:
         return (
@@ -56,6 +96,82 @@ class BaseSolver(ABC, Generic[PageT]):
         except KeyError:
             pass
 
+    @staticmethod
+    def _extract_token(body: bytes) -> Optional[str]:
+        """
+        Extract the reCAPTCHA token from a userverify response body.
+
+        Parameters
+        ----------
+        body : bytes
+            The userverify response body.
+
+        Returns
+        -------
+        Optional[str]
+            The reCAPTCHA token. Returns None if the body does not contain a token.
+        """
+        token_start = body.find(TOKEN_PREFIX)
+
+        if token_start == -1:
+            return None
+
+        token_start += len(TOKEN_PREFIX)
+        token_end = body.find(b'"', token_start)
+
+        if token_end == -1:
+            return None
+
+        return body[token_start:token_end].decode()
+
+    @staticmethod
+    def _convert_audio_to_audio_data(
+        audio_data: bytes,
+    ) -> Optional[speech_recognition.AudioData]:
+        """
+        Decode MP3 audio data to mono 16 kHz PCM audio data with FFmpeg.
+
+        Parameters
+        ----------
+        audio_data : bytes
+            The MP3 audio data.
+
+        Returns
+        -------
+        Optional[speech_recognition.AudioData]
+            The PCM audio data. Returns None if the audio could not be decoded.
+        """
+        command = [
+            AudioSegment.converter,
+            "-loglevel",
+            "error",
+            "-f",
+            "mp3",
+            "-i",
+            "pipe:0",
+            "-ac",
+            "1",
+            "-ar",
+            str(AUDIO_SAMPLE_RATE),
+            "-f",
+            "s16le",
+            "pipe:1",
+        ]
+
+        try:
+            process = subprocess.run(
+                command, input=audio_data, capture_output=True, check=True
+            )
+        except subprocess.CalledProcessError:
+            return None
+
+        if not process.stdout:
+            return None
+
+        return speech_recognition.AudioData(
+            process.stdout, AUDIO_SAMPLE_RATE, AUDIO_SAMPLE_WIDTH
+        )
+
     @staticmethod
     @abstractmethod
     def _get_task_object(recaptcha_box: RecaptchaBox) -> Optional[str]:
@@ -86,23 +202,22 @@ class BaseSolver(ABC, Generic[PageT]):
 
     @abstractmethod
     def _get_capsolver_response(
-        self, recaptcha_box: RecaptchaBox, image_data: bytes
-    ) -> Optional[Dict[str, Any]]:
+        self, image_data: bytes, task_object: str
+    ) -> Dict[str, Any]:
         """
         Get the CapSolver JSON response for an image.
 
         Parameters
         ----------
-        recaptcha_box : RecaptchaBox
-            The reCAPTCHA box.
         image_data : bytes
             The image data.
+        task_object : str
+            The ID of the object in the reCAPTCHA image challenge task.
 
         Returns
         -------
-        Optional[Dict[str, Any]]
+        Dict[str, Any]
             The CapSolver JSON response.
-            Returns None if the task object is not recognized.
 
         Raises
         ------
@@ -111,7 +226,9 @@ class BaseSolver(ABC, Generic[PageT]):
         """
 
     @abstractmethod
-    def _solve_tiles(self, recaptcha_box: RecaptchaBox, indexes: Iterable[int]) -> None:
+    def _solve_tiles(
+        self, recaptcha_box: RecaptchaBox, indexes: Iterable[int], task_object: str
+    ) -> None:
         """
         Solve the tiles in the reCAPTCHA image challenge.
 
@@ -121,6 +238,8 @@ class BaseSolver(ABC, Generic[PageT]):
             The reCAPTCHA box.
         indexes : Iterable[int]
             The indexes of the tiles that contain the task object.
+        task_object : str
+            The ID of the object in the reCAPTCHA image challenge task.
 
         Raises
         ------
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import re
 from abc import ABC, abstractmethod
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Generic, Iterable, List, Pattern, Tuple, TypeVar, Union
 
 from playwright.async_api import Frame as AsyncFrame
@@ -16,6 +16,9 @@ from .translations import ELEMENT_TRANSLATIONS
 FrameT = TypeVar("FrameT", AsyncFrame, SyncFrame)
 Locator = Union[AsyncLocator, SyncLocator]
 
+ANCHOR_URL_PATTERN = re.compile("/recaptcha/(?:api2|enterprise)/anchor")
+BFRAME_URL_PATTERN = re.compile("/recaptcha/(?:api2|enterprise)/bframe")
+
 
 class RecaptchaBox(ABC, Generic[FrameT]):
     """
@@ -64,13 +67,13 @@ class RecaptchaBox(ABC, Generic[FrameT]):
         anchor_frames = [
             frame
             for frame in frames
-            if re.search("/recaptcha/(api2|enterprise)/anchor", frame.url) is not None
+            if ANCHOR_URL_PATTERN.search(frame.url) is not None
         ]
 
         bframe_frames = [
             frame
             for frame in frames
-            if re.search("/recaptcha/(api2|enterprise)/bframe", frame.url) is not None
+            if BFRAME_URL_PATTERN.search(frame.url) is not None
         ]
 
         frame_pairs = []
@@ -90,14 +93,15 @@ class RecaptchaBox(ABC, Generic[FrameT]):
         return frame_pairs
 
     @staticmethod
-    def _get_translations_pattern(translations: Iterable[str]) -> Pattern:
+    @lru_cache(maxsize=None)
+    def _get_translations_pattern(translations: Tuple[str, ...]) -> Pattern:
         """
-        Get a compiled regex pattern from a list of translations.
+        Get a compiled regex pattern from a tuple of translations.
 
         Parameters
         ----------
-        translations : Iterable[str]
-            A list of translations to compile into a regex pattern.
+        translations : Tuple[str, ...]
+            A tuple of translations to compile into a regex pattern.
 
         Returns
         -------
@@ -1,17 +1,14 @@
 from __future__ import annotations
 
 import base64
-import re
-from datetime import datetime
-from io import BytesIO
+import time
 from json import JSONDecodeError
 from typing import Any, Dict, List, Optional
 from urllib.parse import parse_qs, urlparse
 
 import speech_recognition
-from playwright.sync_api import Locator, Page, Response
-from pydub import AudioSegment
-from pydub.exceptions import CouldntDecodeError
+from playwright.sync_api import Page, Response
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from tenacity import Retrying, retry_if_exception_type, stop_after_delay, wait_fixed
 
 from ..errors import (
@@ -20,9 +17,16 @@ from ..errors import (
     RecaptchaRateLimitError,
     RecaptchaSolveError,
 )
-from .base_solver import BaseSolver
+from .base_solver import (
+    PAYLOAD_URL_PATTERN,
+    RELOAD_URL_PATTERN,
+    TASK_OBJECT_IDS,
+    TOKEN_TIMEOUT,
+    USERVERIFY_URL_PATTERN,
+    BaseSolver,
+)
 from .recaptcha_box import SyncRecaptchaBox
-from .translations import OBJECT_TRANSLATIONS, ORIGINAL_LANGUAGE_AUDIO
+from .translations import ORIGINAL_LANGUAGE_AUDIO
 
 
 class SyncSolver(BaseSolver[Page]):
@@ -61,33 +65,11 @@ class SyncSolver(BaseSolver[Page]):
         Optional[str]
             The object ID. Returns None if the task object is not recognized.
         """
-        object_dict = {
-            "/m/0pg52": OBJECT_TRANSLATIONS["taxis"],
-            "/m/01bjv": OBJECT_TRANSLATIONS["bus"],
-            "/m/04_sv": OBJECT_TRANSLATIONS["motorcycles"],
-            "/m/013xlm": OBJECT_TRANSLATIONS["tractors"],
-            "/m/01jk_4": OBJECT_TRANSLATIONS["chimneys"],
-            "/m/014xcs": OBJECT_TRANSLATIONS["crosswalks"],
-            "/m/015qff": OBJECT_TRANSLATIONS["traffic_lights"],
-            "/m/0199g": OBJECT_TRANSLATIONS["bicycles"],
-            "/m/015qbp": OBJECT_TRANSLATIONS["parking_meters"],
-            "/m/0k4j": OBJECT_TRANSLATIONS["cars"],
-            "/m/015kr": OBJECT_TRANSLATIONS["bridges"],
-            "/m/019jd": OBJECT_TRANSLATIONS["boats"],
-            "/m/0cdl1": OBJECT_TRANSLATIONS["palm_trees"],
-            "/m/09d_r": OBJECT_TRANSLATIONS["mountains_or_hills"],
-            "/m/01pns0": OBJECT_TRANSLATIONS["fire_hydrant"],
-            "/m/01lynh": OBJECT_TRANSLATIONS["stairs"],
-        }
-
-        task = recaptcha_box.bframe_frame.locator("div").all_inner_texts()
-        object_ = task[0].split("\n")[1]
+        object_ = recaptcha_box.bframe_frame.locator(
+            ".rc-imageselect-desc-wrapper strong"
+        ).first.text_content()
 
-        for object_id, translations in object_dict.items():
-            if object_ in translations:
-                return object_id
-
-        return None
+        return TASK_OBJECT_IDS.get(object_)
 
     def _response_callback(self, response: Response) -> None:
         """
@@ -98,49 +80,77 @@ class SyncSolver(BaseSolver[Page]):
         response : Response
             The response.
         """
+        url = response.url
+
+        if "/recaptcha/" not in url:
+            return
+
         if (
-            re.search("/recaptcha/(api2|enterprise)/payload", response.url) is not None
-            and self._payload_response is None
+            self._payload_response is None
+            and PAYLOAD_URL_PATTERN.search(url) is not None
         ):
             self._payload_response = response
-        elif (
-            re.search("/recaptcha/(api2|enterprise)/userverify", response.url)
-            is not None
+        elif self._token is None and USERVERIFY_URL_PATTERN.search(url) is not None:
+            token = self._extract_token(response.body())
+
+            if token is not None:
+                self._token = token
+
+    def _wait_for_token(self) -> str:
+        """
+        Wait for the userverify response to deliver the reCAPTCHA token.
+
+        Returns
+        -------
+        str
+            The `g-recaptcha-response` token.
+
+        Raises
+        ------
+        RecaptchaSolveError
+            If the page was closed or the token was not received in time.
+        """
+        deadline = time.monotonic() + TOKEN_TIMEOUT
+
+        while (
+            self._token is None
+            and not self._page.is_closed()
+            and time.monotonic() < deadline
         ):
-            token_match = re.search('"uvresp","(.*?)"', response.text())
+            self._page.wait_for_timeout(250)
+
+        if self._token is None:
+            raise RecaptchaSolveError(
+                "The reCAPTCHA token was not received before the page closed "
+                "or the timeout was exceeded."
+            )
 
-            if token_match is not None:
-                self._token = token_match.group(1)
+        return self._token
 
     def _get_capsolver_response(
-        self, recaptcha_box: SyncRecaptchaBox, image_data: bytes
-    ) -> Optional[Dict[str, Any]]:
+        self, image_data: bytes, task_object: str
+    ) -> Dict[str, Any]:
         """
         Get the CapSolver JSON response for an image.
 
         Parameters
         ----------
-        recaptcha_box : SyncRecaptchaBox
-            The reCAPTCHA box.
         image_data : bytes
             The image data.
+        task_object : str
+            The ID of the object in the reCAPTCHA image challenge task.
 
         Returns
         -------
-        Optional[Dict[str, Any]]
+        Dict[str, Any]
             The CapSolver JSON response.
-            Returns None if the task object is not recognized.
 
         Raises
         ------
         CapSolverError
             If the CapSolver API returned an error.
         """
-        image = base64.b64encode(image_data).decode("utf-8")
-        task_object = self._get_task_object(recaptcha_box)
-
-        if task_object is None:
-            return None
+        image = base64.b64encode(image_data).decode("ascii")
 
         payload = {
             "clientKey": self._capsolver_api_key,
@@ -165,7 +175,9 @@ class SyncSolver(BaseSolver[Page]):
 
         return response_json
 
-    def _solve_tiles(self, recaptcha_box: SyncRecaptchaBox, indexes: List[int]) -> None:
+    def _solve_tiles(
+        self, recaptcha_box: SyncRecaptchaBox, indexes: List[int], task_object: str
+    ) -> None:
         """
         Solve the tiles in the reCAPTCHA image challenge.
 
@@ -175,14 +187,16 @@ class SyncSolver(BaseSolver[Page]):
             The reCAPTCHA box.
         indexes : List[int]
             The indexes of the tiles that contain the task object.
+        task_object : str
+            The ID of the object in the reCAPTCHA image challenge task.
 
         Raises
         ------
         CapSolverError
             If the CapSolver API returned an error.
         """
-        changing_tiles: Dict[Locator, str] = {}
-        indexes = indexes.copy()
+        tiles = recaptcha_box.tile_selector
+        changing_tiles: Dict[int, str] = {}
 
         style_script = """
         (element) => {
@@ -191,39 +205,57 @@ class SyncSolver(BaseSolver[Page]):
         }
         """
 
+        state_script = """
+        (tiles) => tiles.map((tile) => ({
+            isChanging: tile.classList.contains("rc-imageselect-dynamic-selected"),
+            imageUrl: tile.querySelector("img")?.getAttribute("src"),
+        }))
+        """
+
+        initial_states = tiles.evaluate_all(state_script)
+
         for index in indexes:
-            tile = recaptcha_box.tile_selector.nth(index)
-            tile.click()
+            tiles.nth(index).click()
 
-            if "rc-imageselect-dynamic-selected" not in tile.get_attribute("class"):
+        tile_states = tiles.evaluate_all(state_script)
+
+        for index in indexes:
+            image_url = initial_states[index]["imageUrl"]
+
+            if (
+                not tile_states[index]["isChanging"]
+                and tile_states[index]["imageUrl"] == image_url
+            ):
                 continue
 
-            changing_tiles[tile] = tile.locator("img").get_attribute("src")
-            tile.evaluate(style_script)
+            changing_tiles[index] = image_url
+            tiles.nth(index).evaluate(style_script)
 
-        start_time = datetime.now()
+        deadline = time.monotonic() + 60
 
-        while changing_tiles and (datetime.now() - start_time).seconds < 60:
-            for tile in changing_tiles.copy():
-                image_url = tile.locator("img").get_attribute("src")
+        while changing_tiles and time.monotonic() < deadline:
+            new_tiles: Dict[int, str] = {}
+            tile_states = tiles.evaluate_all(state_script)
 
-                if changing_tiles[tile] == image_url:
-                    continue
+            for index, image_url in changing_tiles.items():
+                new_image_url = tile_states[index]["imageUrl"]
+
+                if new_image_url is not None and new_image_url != image_url:
+                    new_tiles[index] = new_image_url
 
-                changing_tiles[tile] = image_url
+            for index, image_url in new_tiles.items():
+                changing_tiles[index] = image_url
                 response = self._page.request.get(image_url)
 
                 capsolver_response = self._get_capsolver_response(
-                    recaptcha_box, response.body()
+                    response.body(), task_object
                 )
 
-                if (
-                    capsolver_response is None
-                    or not capsolver_response["solution"]["hasObject"]
-                ):
-                    changing_tiles.pop(tile)
+                if not capsolver_response["solution"]["hasObject"]:
+                    changing_tiles.pop(index)
                     continue
 
+                tile = tiles.nth(index)
                 tile.click()
                 tile.evaluate(style_script)
 
@@ -247,23 +279,13 @@ class SyncSolver(BaseSolver[Page]):
             Returns None if the audio could not be converted.
         """
         response = self._page.request.get(audio_url)
+        audio_data = self._convert_audio_to_audio_data(response.body())
 
-        wav_audio = BytesIO()
-        mp3_audio = BytesIO(response.body())
-
-        try:
-            audio: AudioSegment = AudioSegment.from_mp3(mp3_audio)
-        except CouldntDecodeError:
+        if audio_data is None:
             return None
 
-        audio.export(wav_audio, format="wav")
-        recognizer = speech_recognition.Recognizer()
-
-        with speech_recognition.AudioFile(wav_audio) as source:
-            audio_data = recognizer.record(source)
-
         try:
-            return recognizer.recognize_google(audio_data, language=language)
+            return self._recognizer.recognize_google(audio_data, language=language)
         except speech_recognition.UnknownValueError:
             return None
 
@@ -338,9 +360,7 @@ class SyncSolver(BaseSolver[Page]):
         """
         recaptcha_box.audio_challenge_textbox.fill(text)
 
-        with self._page.expect_response(
-            re.compile("/recaptcha/(api2|enterprise)/userverify")
-        ):
+        with self._page.expect_response(USERVERIFY_URL_PATTERN):
             recaptcha_box.verify_button.click()
 
         while recaptcha_box.frames_are_attached():
@@ -386,9 +406,7 @@ class SyncSolver(BaseSolver[Page]):
                 recaptcha_box.check_new_images_is_visible()
                 or recaptcha_box.select_all_matching_is_visible()
             ):
-                with self._page.expect_response(
-                    re.compile("/recaptcha/(api2|enterprise)/payload")
-                ):
+                with self._page.expect_response(PAYLOAD_URL_PATTERN):
                     recaptcha_box.new_challenge_button.click()
 
                 return
@@ -412,30 +430,40 @@ class SyncSolver(BaseSolver[Page]):
             If the reCAPTCHA rate limit has been exceeded.
         """
         while recaptcha_box.frames_are_attached():
-            capsolver_response = self._get_capsolver_response(
-                recaptcha_box, self._payload_response.body()
-            )
+            task_object = self._get_task_object(recaptcha_box)
+            capsolver_response = None
+
+            if task_object is not None:
+                capsolver_response = self._get_capsolver_response(
+                    self._payload_response.body(), task_object
+                )
 
             if (
                 capsolver_response is None
                 or not capsolver_response["solution"]["objects"]
             ):
-                self._payload_response = None
+                try:
+                    with self._page.expect_response(PAYLOAD_URL_PATTERN) as response:
+                        with self._page.expect_response(RELOAD_URL_PATTERN):
+                            recaptcha_box.new_challenge_button.click()
 
-                with self._page.expect_response(
-                    re.compile("/recaptcha/(api2|enterprise)/reload")
-                ):
-                    recaptcha_box.new_challenge_button.click()
+                        while not response.is_done():
+                            if recaptcha_box.rate_limit_is_visible():
+                                raise RecaptchaRateLimitError
 
-                while self._payload_response is None:
+                            self._page.wait_for_timeout(250)
+                except PlaywrightTimeoutError as err:
                     if recaptcha_box.rate_limit_is_visible():
-                        raise RecaptchaRateLimitError
+                        raise RecaptchaRateLimitError from err
 
-                    self._page.wait_for_timeout(250)
+                    raise
 
+                self._payload_response = response.value
                 continue
 
-            self._solve_tiles(recaptcha_box, capsolver_response["solution"]["objects"])
+            self._solve_tiles(
+                recaptcha_box, capsolver_response["solution"]["objects"], task_object
+            )
             self._payload_response = None
 
             button = recaptcha_box.skip_button.or_(recaptcha_box.next_button)
@@ -444,9 +472,7 @@ class SyncSolver(BaseSolver[Page]):
                 self._submit_tile_answers(recaptcha_box)
                 return
 
-            with self._page.expect_response(
-                re.compile("/recaptcha/(api2|enterprise)/payload")
-            ):
+            with self._page.expect_response(PAYLOAD_URL_PATTERN):
                 button.click()
 
     def _solve_audio_challenge(self, recaptcha_box: SyncRecaptchaBox) -> None:
@@ -477,9 +503,7 @@ class SyncSolver(BaseSolver[Page]):
             if text is not None:
                 break
 
-            with self._page.expect_response(
-                re.compile("/recaptcha/(api2|enterprise)/reload")
-            ):
+            with self._page.expect_response(RELOAD_URL_PATTERN):
                 recaptcha_box.new_challenge_button.click()
 
             while url == self._get_audio_url(recaptcha_box):
@@ -549,72 +573,73 @@ class SyncSolver(BaseSolver[Page]):
 
         self._token = None
         attempts = attempts or self._attempts
+        self._page.on("response", self._response_callback)
 
-        if wait:
-            retry = Retrying(
-                sleep=self._page.wait_for_timeout,
-                stop=stop_after_delay(wait_timeout),
-                wait=wait_fixed(0.25),
-                retry=retry_if_exception_type(RecaptchaNotFoundError),
-                reraise=True,
-            )
-
-            recaptcha_box = retry(
-                lambda: SyncRecaptchaBox.from_frames(self._page.frames)
-            )
-        else:
-            recaptcha_box = SyncRecaptchaBox.from_frames(self._page.frames)
-
-        if recaptcha_box.rate_limit_is_visible():
-            raise RecaptchaRateLimitError
-
-        if recaptcha_box.checkbox.is_visible():
-            self._click_checkbox(recaptcha_box)
+        try:
+            if wait:
+                retry = Retrying(
+                    sleep=self._page.wait_for_timeout,
+                    stop=stop_after_delay(wait_timeout),
+                    wait=wait_fixed(0.25),
+                    retry=retry_if_exception_type(RecaptchaNotFoundError),
+                    reraise=True,
+                )
 
-            if self._token is not None:
-                return self._token
+                recaptcha_box = retry(
+                    lambda: SyncRecaptchaBox.from_frames(self._page.frames)
+                )
+            else:
+                recaptcha_box = SyncRecaptchaBox.from_frames(self._page.frames)
 
-            if (
-                recaptcha_box.frames_are_detached()
-                or not recaptcha_box.any_challenge_is_visible()
-                or recaptcha_box.challenge_is_solved()
-            ):
-                while self._token is None:
-                    self._page.wait_for_timeout(250)
+            if recaptcha_box.rate_limit_is_visible():
+                raise RecaptchaRateLimitError
 
-                return self._token
+            if recaptcha_box.checkbox.is_visible():
+                self._click_checkbox(recaptcha_box)
 
-        while not recaptcha_box.any_challenge_is_visible():
-            self._page.wait_for_timeout(250)
+                if self._token is not None:
+                    return self._token
 
-        if image_challenge and recaptcha_box.image_challenge_button.is_visible():
-            recaptcha_box.image_challenge_button.click()
-        elif not image_challenge and recaptcha_box.audio_challenge_button.is_visible():
-            recaptcha_box.audio_challenge_button.click()
+                if (
+                    recaptcha_box.frames_are_detached()
+                    or not recaptcha_box.any_challenge_is_visible()
+                    or recaptcha_box.challenge_is_solved()
+                ):
+                    return self._wait_for_token()
 
-        if image_challenge:
-            image = recaptcha_box.image_challenge.locator("img").first
-            image_url = image.get_attribute("src")
-            self._payload_response = self._page.request.get(image_url)
+            while not recaptcha_box.any_challenge_is_visible():
+                self._page.wait_for_timeout(250)
 
-        while attempts > 0:
-            self._token = None
+            if image_challenge and recaptcha_box.image_challenge_button.is_visible():
+                recaptcha_box.image_challenge_button.click()
+            elif (
+                not image_challenge
+                and recaptcha_box.audio_challenge_button.is_visible()
+            ):
+                recaptcha_box.audio_challenge_button.click()
 
             if image_challenge:
-                self._solve_image_challenge(recaptcha_box)
-            else:
-                self._solve_audio_challenge(recaptcha_box)
+                image = recaptcha_box.image_challenge.locator("img").first
+                image_url = image.get_attribute("src")
+                self._payload_response = self._page.request.get(image_url)
 
-            if (
-                recaptcha_box.frames_are_detached()
-                or not recaptcha_box.any_challenge_is_visible()
-                or recaptcha_box.challenge_is_solved()
-            ):
-                while self._token is None:
-                    self._page.wait_for_timeout(250)
+            while attempts > 0:
+                self._token = None
+
+                if image_challenge:
+                    self._solve_image_challenge(recaptcha_box)
+                else:
+                    self._solve_audio_challenge(recaptcha_box)
 
-                return self._token
+                if (
+                    recaptcha_box.frames_are_detached()
+                    or not recaptcha_box.any_challenge_is_visible()
+                    or recaptcha_box.challenge_is_solved()
+                ):
+                    return self._wait_for_token()
 
-            attempts -= 1
+                attempts -= 1
 
-        raise RecaptchaSolveError
+            raise RecaptchaSolveError
+        finally:
+            self.close()
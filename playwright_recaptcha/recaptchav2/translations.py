@@ -336,4 +336,4 @@ OBJECT_TRANSLATIONS = {
     ),
 }
 
-ORIGINAL_LANGUAGE_AUDIO = ("de", "es", "fr", "it", "nl", "pt")
+ORIGINAL_LANGUAGE_AUDIO = frozenset(("de", "es", "fr", "it", "nl", "pt"))
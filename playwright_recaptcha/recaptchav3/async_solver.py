@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-import re
-import time
+import asyncio
 from typing import Any, Optional
 
 from playwright.async_api import Page, Response
 
 from ..errors import RecaptchaTimeoutError
-from .base_solver import BaseSolver
+from .base_solver import RELOAD_URL_PATTERN, BaseSolver
 
 
 class AsyncSolver(BaseSolver[Page]):
@@ -22,6 +21,10 @@ class AsyncSolver(BaseSolver[Page]):
         The solve timeout in seconds, by default 30.
     """
 
+    def __init__(self, page: Page, timeout: float = 30) -> None:
+        self._token_event = asyncio.Event()
+        super().__init__(page, timeout)
+
     async def __aenter__(self) -> AsyncSolver:
         return self
 
@@ -37,13 +40,16 @@ class AsyncSolver(BaseSolver[Page]):
         response : Response
             The response.
         """
-        if re.search("/recaptcha/(api2|enterprise)/reload", response.url) is None:
+        url = response.url
+
+        if "/recaptcha/" not in url or RELOAD_URL_PATTERN.search(url) is None:
             return
 
-        token_match = re.search('"rresp","(.*?)"', await response.text())
+        token = self._extract_token(await response.body())
 
-        if token_match is not None:
-            self._token = token_match.group(1)
+        if token is not None:
+            self._token = token
+            self._token_event.set()
 
     async def solve_recaptcha(self, timeout: Optional[float] = None) -> str:
         """
@@ -65,13 +71,12 @@ class AsyncSolver(BaseSolver[Page]):
             If the solve timeout has been exceeded.
         """
         self._token = None
+        self._token_event.clear()
         timeout = timeout or self._timeout
-        start_time = time.time()
-
-        while self._token is None:
-            if time.time() - start_time >= timeout:
-                raise RecaptchaTimeoutError
 
-            await self._page.wait_for_timeout(250)
+        try:
+            await asyncio.wait_for(self._token_event.wait(), timeout)
+        except asyncio.TimeoutError as err:
+            raise RecaptchaTimeoutError from err
 
         return self._token
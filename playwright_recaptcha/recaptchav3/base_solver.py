@@ -1,3 +1,4 @@
+import re
 from abc import ABC, abstractmethod
 from typing import Generic, Optional, TypeVar, Union
 
@@ -9,6 +10,9 @@ from playwright.sync_api import Response as SyncResponse
 PageT = TypeVar("PageT", AsyncPage, SyncPage)
 Response = Union[AsyncResponse, SyncResponse]
 
+RELOAD_URL_PATTERN = re.compile("/recaptcha/(?:api2|enterprise)/reload")
+TOKEN_PREFIX = b'"rresp","'
+
 
 class BaseSolver(ABC, Generic[PageT]):
     """
@@ -42,6 +46,34 @@ class BaseSolver(ABC, Generic[PageT]):
         except KeyError:
             pass
 
+    @staticmethod
+    def _extract_token(body: bytes) -> Optional[str]:
+        """
+        Extract the reCAPTCHA token from a reload response body.
+
+        Parameters
+        ----------
+        body : bytes
+            The reload response body.
+
+        Returns
+        -------
+        Optional[str]
+            The reCAPTCHA token. Returns None if the body does not contain a token.
+        """
+        token_start = body.find(TOKEN_PREFIX)
+
+        if token_start == -1:
+            return None
+
+        token_start += len(TOKEN_PREFIX)
+        token_end = body.find(b'"', token_start)
+
+        if token_end == -1:
+            return None
+
+        return body[token_start:token_end].decode()
+
     @abstractmethod
     def _response_callback(self, response: Response) -> None:
         """
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-import re
 import time
 from typing import Any, Optional
 
 from playwright.sync_api import Page, Response
 
 from ..errors import RecaptchaTimeoutError
-from .base_solver import BaseSolver
+from .base_solver import RELOAD_URL_PATTERN, BaseSolver
 
 
 class SyncSolver(BaseSolver[Page]):
@@ -37,13 +36,15 @@ class SyncSolver(BaseSolver[Page]):
         response : Response
             The response.
         """
-        if re.search("/recaptcha/(api2|enterprise)/reload", response.url) is None:
+        url = response.url
+
+        if "/recaptcha/" not in url or RELOAD_URL_PATTERN.search(url) is None:
             return
 
-        token_match = re.search('"rresp","(.*?)"', response.text())
+        token = self._extract_token(response.body())
 
-        if token_match is not None:
-            self._token = token_match.group(1)
+        if token is not None:
+            self._token = token
 
     def solve_recaptcha(self, timeout: Optional[float] = None) -> str:
         """
@@ -65,11 +66,10 @@ class SyncSolver(BaseSolver[Page]):
             If the solve timeout has been exceeded.
         """
         self._token = None
-        timeout = timeout or self._timeout
-        start_time = time.time()
+        deadline = time.monotonic() + (timeout or self._timeout)
 
         while self._token is None:
-            if time.time() - start_time >= timeout:
+            if time.monotonic() >= deadline:
                 raise RecaptchaTimeoutError
 
             self._page.wait_for_timeout(250)
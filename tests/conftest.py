@@ -0,0 +1,250 @@
+import os
+import socket
+from typing import AsyncGenerator, Dict, Generator, List
+from urllib.parse import urlsplit
+
+import pytest
+import pytest_asyncio
+from playwright.async_api import Browser as AsyncBrowser
+from playwright.async_api import Page as AsyncPage
+from playwright.async_api import Playwright as AsyncPlaywright
+from playwright.async_api import Route as AsyncRoute
+from playwright.async_api import async_playwright
+from playwright.sync_api import Browser as SyncBrowser
+from playwright.sync_api import Page as SyncPage
+from playwright.sync_api import Playwright as SyncPlaywright
+from playwright.sync_api import Route as SyncRoute
+from playwright.sync_api import sync_playwright
+
+from playwright_recaptcha import RecaptchaRateLimitError
+
+BLOCKED_RESOURCE_TYPES = frozenset(("image", "font", "media"))
+BLOCKED_HOSTS = ("doubleclick.net", "google-analytics.com", "googletagmanager.com")
+RATE_LIMITED = pytest.StashKey[bool]()
+
+SLOW_MO_VALUES = [
+    pytest.param(0, id="normal_browser"),
+    pytest.param(1000, id="slow_browser", marks=pytest.mark.slow),
+]
+
+
+def _is_blocked(url: str, resource_type: str) -> bool:
+    """
+    Check if a request is irrelevant to the solvers and can be aborted.
+
+    Parameters
+    ----------
+    url : str
+        The request URL.
+    resource_type : str
+        The request resource type.
+
+    Returns
+    -------
+    bool
+        Whether the request can be aborted.
+    """
+    if "/recaptcha/" in url:
+        return False
+
+    hostname = urlsplit(url).hostname or ""
+
+    return resource_type in BLOCKED_RESOURCE_TYPES or any(
+        hostname == host or hostname.endswith(f".{host}") for host in BLOCKED_HOSTS
+    )
+
+
+def _has_internet_access() -> bool:
+    """
+    Check if the internet can be reached.
+
+    Returns
+    -------
+    bool
+        Whether a connection to Google could be opened.
+    """
+    try:
+        with socket.create_connection(("www.google.com", 443), timeout=2):
+            return True
+    except OSError:
+        return False
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the option for running tests that require internet access."""
+    parser.addoption(
+        "--run-network",
+        action="store_true",
+        default=False,
+        help="run tests that require internet access",
+    )
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Run tests marked with `slow_mo_variants` in a normal and a slow browser."""
+    if metafunc.definition.get_closest_marker("slow_mo_variants") is None:
+        return
+
+    for fixture in ("async_page", "sync_page"):
+        if fixture in metafunc.fixturenames:
+            metafunc.parametrize(fixture, SLOW_MO_VALUES, indirect=True)
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: List[pytest.Item]
+) -> None:
+    """
+    Skip tests marked with `network` unless `--run-network` is given
+    and the internet can be reached.
+    """
+    if not config.getoption("--run-network"):
+        skip_network = pytest.mark.skip(reason="needs --run-network to run")
+    elif _has_internet_access():
+        return
+    else:
+        skip_network = pytest.mark.skip(reason="no internet access")
+
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item: pytest.Item) -> None:
+    """Skip reCAPTCHA v2 network tests once the rate limit has been hit."""
+    if (
+        item.config.stash.get(RATE_LIMITED, False)
+        and "network" in item.keywords
+        and "recaptchav2" in item.path.name
+    ):
+        pytest.skip("reCAPTCHA rate limit was exceeded earlier in the session")
+
+
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo) -> None:
+    """Remember when a test runs into the reCAPTCHA rate limit."""
+    if call.excinfo is not None and call.excinfo.errisinstance(RecaptchaRateLimitError):
+        item.config.stash[RATE_LIMITED] = True
+
+
+async def _async_route_callback(route: AsyncRoute) -> None:
+    """Abort requests for assets and analytics that reCAPTCHA does not need."""
+    if _is_blocked(route.request.url, route.request.resource_type):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def _sync_route_callback(route: SyncRoute) -> None:
+    """Abort requests for assets and analytics that reCAPTCHA does not need."""
+    if _is_blocked(route.request.url, route.request.resource_type):
+        route.abort()
+    else:
+        route.continue_()
+
+
+@pytest.fixture(scope="session")
+def capsolver_api_key() -> str:
+    """Get the CapSolver API key, skipping the test if it is not set."""
+    api_key = os.getenv("CAPSOLVER_API_KEY")
+
+    if not api_key:
+        pytest.skip("CAPSOLVER_API_KEY is not set")
+
+    return api_key
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_playwright_instance() -> AsyncGenerator[AsyncPlaywright, None]:
+    """Start the async Playwright driver once for the whole test session."""
+    async with async_playwright() as playwright:
+        yield playwright
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_browsers(
+    async_playwright_instance: AsyncPlaywright,
+) -> AsyncGenerator[Dict[int, AsyncBrowser], None]:
+    """Pool of async browsers shared by every async test, keyed by `slow_mo`."""
+    browsers: Dict[int, AsyncBrowser] = {}
+    yield browsers
+
+    for browser in browsers.values():
+        await browser.close()
+
+
+@pytest_asyncio.fixture
+async def async_page(
+    request: pytest.FixtureRequest,
+    async_playwright_instance: AsyncPlaywright,
+    async_browsers: Dict[int, AsyncBrowser],
+) -> AsyncGenerator[AsyncPage, None]:
+    """
+    Open an async page in a fresh browser context.
+
+    Parametrize indirectly with a `slow_mo` value to get a page from a slowed
+    down browser. Browsers are launched on first use and kept in the pool.
+    Images, fonts, media and analytics outside of reCAPTCHA are not loaded.
+    """
+    slow_mo: int = getattr(request, "param", 0)
+
+    if slow_mo not in async_browsers:
+        async_browsers[slow_mo] = await async_playwright_instance.firefox.launch(
+            slow_mo=slow_mo
+        )
+
+    context = await async_browsers[slow_mo].new_context()
+    await context.route("**/*", _async_route_callback)
+    yield await context.new_page()
+    await context.close()
+
+
+@pytest.fixture(scope="module")
+def sync_playwright_instance() -> Generator[SyncPlaywright, None, None]:
+    """
+    Start the sync Playwright driver once per test module.
+
+    The sync driver marks its own event loop as running after every call, which
+    breaks the session event loop of any async test that runs while it is alive.
+    Stopping it at the end of each module keeps the async tests runnable in any
+    order.
+    """
+    with sync_playwright() as playwright:
+        yield playwright
+
+
+@pytest.fixture(scope="module")
+def sync_browsers(
+    sync_playwright_instance: SyncPlaywright,
+) -> Generator[Dict[int, SyncBrowser], None, None]:
+    """Pool of sync browsers shared by the tests in a module, keyed by `slow_mo`."""
+    browsers: Dict[int, SyncBrowser] = {}
+    yield browsers
+
+    for browser in browsers.values():
+        browser.close()
+
+
+@pytest.fixture
+def sync_page(
+    request: pytest.FixtureRequest,
+    sync_playwright_instance: SyncPlaywright,
+    sync_browsers: Dict[int, SyncBrowser],
+) -> Generator[SyncPage, None, None]:
+    """
+    Open a sync page in a fresh browser context.
+
+    Parametrize indirectly with a `slow_mo` value to get a page from a slowed
+    down browser. Browsers are launched on first use and kept in the pool.
+    Images, fonts, media and analytics outside of reCAPTCHA are not loaded.
+    """
+    slow_mo: int = getattr(request, "param", 0)
+
+    if slow_mo not in sync_browsers:
+        sync_browsers[slow_mo] = sync_playwright_instance.firefox.launch(
+            slow_mo=slow_mo
+        )
+
+    context = sync_browsers[slow_mo].new_context()
+    context.route("**/*", _sync_route_callback)
+    yield context.new_page()
+    context.close()
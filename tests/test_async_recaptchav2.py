@@ -1,5 +1,5 @@
 import pytest
-from playwright.async_api import async_playwright
+from playwright.async_api import Page
 
 from playwright_recaptcha import (
     CapSolverError,
@@ -8,69 +8,53 @@ from playwright_recaptcha import (
     recaptchav2,
 )
 
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-@pytest.mark.asyncio
+
+@pytest.mark.network
+@pytest.mark.slow_mo_variants
 @pytest.mark.xfail(raises=RecaptchaRateLimitError)
-async def test_solver_with_normal_recaptcha() -> None:
-    """Test the solver with a normal reCAPTCHA."""
-    async with async_playwright() as playwright:
-        browser = await playwright.firefox.launch()
-        page = await browser.new_page()
-        await page.goto("https://www.google.com/recaptcha/api2/demo")
+async def test_solver_with_normal_recaptcha(async_page: Page) -> None:
+    """Test the solver with a normal reCAPTCHA in a normal and a slow browser."""
+    await async_page.goto(
+        "https://www.google.com/recaptcha/api2/demo", wait_until="domcontentloaded"
+    )
 
-        async with recaptchav2.AsyncSolver(page) as solver:
-            await solver.solve_recaptcha(wait=True)
+    async with recaptchav2.AsyncSolver(async_page) as solver:
+        await solver.solve_recaptcha(wait=True)
 
 
-@pytest.mark.asyncio
+@pytest.mark.network
 @pytest.mark.xfail(raises=(RecaptchaNotFoundError, RecaptchaRateLimitError))
-async def test_solver_with_hidden_recaptcha() -> None:
+async def test_solver_with_hidden_recaptcha(async_page: Page) -> None:
     """Test the solver with a hidden reCAPTCHA."""
-    async with async_playwright() as playwright:
-        browser = await playwright.firefox.launch()
-        page = await browser.new_page()
-
-        await page.goto("https://www.google.com/recaptcha/api2/demo?invisible=true")
-        await page.get_by_role("button").click()
-
-        async with recaptchav2.AsyncSolver(page) as solver:
-            await solver.solve_recaptcha(wait=True)
-
-
-@pytest.mark.asyncio
-@pytest.mark.xfail(raises=RecaptchaRateLimitError)
-async def test_solver_with_slow_browser() -> None:
-    """Test the solver with a slow browser."""
-    async with async_playwright() as playwright:
-        browser = await playwright.firefox.launch(slow_mo=1000)
-        page = await browser.new_page()
-        await page.goto("https://www.google.com/recaptcha/api2/demo")
+    await async_page.goto("https://www.google.com/recaptcha/api2/demo?invisible=true")
+    await async_page.get_by_role("button").click(no_wait_after=True)
 
-        async with recaptchav2.AsyncSolver(page) as solver:
-            await solver.solve_recaptcha(wait=True)
+    async with recaptchav2.AsyncSolver(async_page) as solver:
+        await solver.solve_recaptcha(wait=True)
 
 
-@pytest.mark.asyncio
+@pytest.mark.network
 @pytest.mark.xfail(raises=CapSolverError)
-async def test_solver_with_image_challenge() -> None:
+async def test_solver_with_image_challenge(
+    capsolver_api_key: str, async_page: Page
+) -> None:
     """Test the solver with an image challenge."""
-    async with async_playwright() as playwright:
-        browser = await playwright.firefox.launch()
-        page = await browser.new_page()
-        await page.goto("https://www.google.com/recaptcha/api2/demo")
+    await async_page.goto(
+        "https://www.google.com/recaptcha/api2/demo", wait_until="domcontentloaded"
+    )
 
-        async with recaptchav2.AsyncSolver(page) as solver:
-            await solver.solve_recaptcha(wait=True, image_challenge=True)
+    async with recaptchav2.AsyncSolver(
+        async_page, capsolver_api_key=capsolver_api_key
+    ) as solver:
+        await solver.solve_recaptcha(wait=True, image_challenge=True)
 
 
-@pytest.mark.asyncio
-async def test_recaptcha_not_found_error() -> None:
+async def test_recaptcha_not_found_error(async_page: Page) -> None:
     """Test the solver with a page that does not have a reCAPTCHA."""
-    async with async_playwright() as playwright:
-        browser = await playwright.firefox.launch()
-        page = await browser.new_page()
-        await page.goto("https://www.google.com/")
+    await async_page.goto("about:blank")
 
-        with pytest.raises(RecaptchaNotFoundError):
-            async with recaptchav2.AsyncSolver(page) as solver:
-                await solver.solve_recaptcha()
+    with pytest.raises(RecaptchaNotFoundError):
+        async with recaptchav2.AsyncSolver(async_page) as solver:
+            await solver.solve_recaptcha()
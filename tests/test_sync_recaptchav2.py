@@ -1,5 +1,5 @@
 import pytest
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import Page
 
 from playwright_recaptcha import (
     CapSolverError,
@@ -9,64 +9,49 @@ from playwright_recaptcha import (
 )
 
 
+@pytest.mark.network
+@pytest.mark.slow_mo_variants
 @pytest.mark.xfail(raises=RecaptchaRateLimitError)
-def test_solver_with_normal_recaptcha() -> None:
-    """Test the solver with a normal reCAPTCHA."""
-    with sync_playwright() as playwright:
-        browser = playwright.firefox.launch()
-        page = browser.new_page()
-        page.goto("https://www.google.com/recaptcha/api2/demo")
+def test_solver_with_normal_recaptcha(sync_page: Page) -> None:
+    """Test the solver with a normal reCAPTCHA in a normal and a slow browser."""
+    sync_page.goto(
+        "https://www.google.com/recaptcha/api2/demo", wait_until="domcontentloaded"
+    )
 
-        with recaptchav2.SyncSolver(page) as solver:
-            solver.solve_recaptcha(wait=True)
+    with recaptchav2.SyncSolver(sync_page) as solver:
+        solver.solve_recaptcha(wait=True)
 
 
+@pytest.mark.network
 @pytest.mark.xfail(raises=(RecaptchaNotFoundError, RecaptchaRateLimitError))
-def test_solver_with_hidden_recaptcha() -> None:
+def test_solver_with_hidden_recaptcha(sync_page: Page) -> None:
     """Test the solver with a hidden reCAPTCHA."""
-    with sync_playwright() as playwright:
-        browser = playwright.firefox.launch()
-        page = browser.new_page()
+    sync_page.goto("https://www.google.com/recaptcha/api2/demo?invisible=true")
+    sync_page.get_by_role("button").click(no_wait_after=True)
 
-        page.goto("https://www.google.com/recaptcha/api2/demo?invisible=true")
-        page.get_by_role("button").click()
-
-        with recaptchav2.SyncSolver(page) as solver:
-            solver.solve_recaptcha(wait=True)
-
-
-@pytest.mark.xfail(raises=RecaptchaRateLimitError)
-def test_solver_with_slow_browser() -> None:
-    """Test the solver with a slow browser."""
-    with sync_playwright() as playwright:
-        browser = playwright.firefox.launch(slow_mo=1000)
-        page = browser.new_page()
-        page.goto("https://www.google.com/recaptcha/api2/demo")
-
-        with recaptchav2.SyncSolver(page) as solver:
-            solver.solve_recaptcha(wait=True)
+    with recaptchav2.SyncSolver(sync_page) as solver:
+        solver.solve_recaptcha(wait=True)
 
 
+@pytest.mark.network
 @pytest.mark.xfail(raises=CapSolverError)
-def test_solver_with_image_challenge() -> None:
+def test_solver_with_image_challenge(capsolver_api_key: str, sync_page: Page) -> None:
     """Test the solver with an image challenge."""
-    with sync_playwright() as playwright:
-        browser = playwright.firefox.launch()
-        page = browser.new_page()
-        page.goto("https://www.google.com/recaptcha/api2/demo")
+    sync_page.goto(
+        "https://www.google.com/recaptcha/api2/demo", wait_until="domcontentloaded"
+    )
 
-        with recaptchav2.SyncSolver(page) as solver:
-            solver.solve_recaptcha(wait=True, image_challenge=True)
+    with recaptchav2.SyncSolver(
+        sync_page, capsolver_api_key=capsolver_api_key
+    ) as solver:
+        solver.solve_recaptcha(wait=True, image_challenge=True)
 
 
-def test_recaptcha_not_found_error() -> None:
+def test_recaptcha_not_found_error(sync_page: Page) -> None:
     """Test the solver with a page that does not have a reCAPTCHA."""
-    with sync_playwright() as playwright:
-        browser = playwright.firefox.launch()
-        page = browser.new_page()
-        page.goto("https://www.google.com/")
+    sync_page.goto("about:blank")
 
-        with pytest.raises(RecaptchaNotFoundError), recaptchav2.SyncSolver(
-            page
-        ) as solver:
-            solver.solve_recaptcha()
+    with pytest.raises(RecaptchaNotFoundError), recaptchav2.SyncSolver(
+        sync_page
+    ) as solver:
+        solver.solve_recaptcha()